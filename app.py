@@ -5,38 +5,240 @@ Aggregates multiple APIs and uses AI to generate personalized briefings
 """
 
 import os
+import sys
+import time
+import random
+import atexit
 import asyncio
+import contextlib
+import functools
+import importlib.util
+import inspect
+import threading
+import queue
 import aiohttp
-from datetime import datetime
-from flask import Flask, render_template, jsonify, request
+import orjson
+from datetime import datetime, timezone
+from flask import Flask, Response, render_template, request, stream_with_context
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # uvloop is POSIX-only
+    uvloop = None
+
 load_dotenv()
 
 app = Flask(__name__)
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "dev-secret")
 
+
+def ojsonify(obj):
+    """Like ``jsonify`` but encoded with orjson."""
+    return Response(orjson.dumps(obj), mimetype="application/json")
+
+
 # API Keys (set in .env)
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 WEATHER_API_KEY = os.environ.get("OPENWEATHER_API_KEY")  # openweathermap.org
 NEWS_API_KEY = os.environ.get("NEWS_API_KEY")  # newsapi.org
 ALPHA_VANTAGE_KEY = os.environ.get("ALPHA_VANTAGE_KEY")  # alphavantage.co
+GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")  # github.com/settings/tokens
+
+# Applied to every upstream request via the shared session
+UPSTREAM_TIMEOUT = aiohttp.ClientTimeout(total=8, connect=3, sock_read=5)
+
+COINGECKO_URL = "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin,ethereum,solana&vs_currencies=usd&include_24hr_change=true"
+CRYPTO_MAP = (("bitcoin", "BTC"), ("ethereum", "ETH"), ("solana", "SOL"))
+
+GITHUB_SEARCH_URL = "https://api.github.com/search/repositories?q=created:>2025-01-01&sort=stars&order=desc&per_page=5"
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+# Pre-encoded request body; asks only for the fields the widget shows
+GITHUB_TRENDING_QUERY = orjson.dumps({"query": """{ search(query: "created:>2025-01-01 sort:stars", type: REPOSITORY, first: 5) {
+    nodes { ... on Repository { nameWithOwner stargazerCount description } } } }"""})
+
+QUOTE_URL = "https://api.quotable.io/random"
+QUOTES_FALLBACK = (
+    {"text": "The best way to predict the future is to create it.", "author": "Peter Drucker"},
+    {"text": "Innovation distinguishes between a leader and a follower.", "author": "Steve Jobs"},
+    {"text": "The only way to do great work is to love what you do.", "author": "Steve Jobs"},
+)
+
+BRIEFING_SYSTEM_PROMPT = """You are a personal intelligence briefing assistant.
+Generate a concise, engaging morning briefing based on the provided data.
+Be conversational but professional. Highlight what's most relevant.
+Include 2-3 actionable insights or things to watch today.
+Keep it under 200 words."""
+
+
+_now_cache = [0.0, ""]
+
+
+def iso_now():
+    """Current UTC time as ISO 8601, recomputed at most every 250ms."""
+    t = time.time()
+    if t - _now_cache[0] > 0.25:
+        _now_cache[:] = [t, datetime.fromtimestamp(t, tz=timezone.utc).isoformat()]
+    return _now_cache[1]
+
+
+def error_message(e):
+    """Describe a fetch failure; timeouts otherwise stringify to ''."""
+    if isinstance(e, asyncio.TimeoutError):
+        return "Request timed out"
+    return str(e)
+
+
+async def _safe(name, coro):
+    """Await a fetch, turning an unexpected exception into an error result for ``name``."""
+    try:
+        return await coro
+    except Exception as e:
+        app.logger.warning("%s fetch failed: %r", name, e)
+        return {"source": name, "error": repr(e)}
+
+
+def cached(ttl):
+    """Cache a fetcher's result per argument set for ``ttl`` seconds."""
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(self, session, *args, **kwargs):
+            # Bind with defaults applied so fetch_stocks(session) and
+            # fetch_stocks(session, ["AAPL", "GOOGL", "MSFT"]) share one key
+            bound = signature.bind(self, session, *args, **kwargs)
+            bound.apply_defaults()
+            values = list(bound.arguments.values())[2:]
+            key = (fn.__name__,) + tuple(tuple(v) if isinstance(v, list) else v for v in values)
+            return await self._cached(key, ttl, lambda: fn(self, session, *args, **kwargs))
+        return wrapper
+    return decorator
 
 
 class DataAggregator:
     """Fetches data from multiple APIs concurrently."""
 
     def __init__(self):
-        self.cache = {}
-        self.cache_ttl = 300  # 5 minutes
-
+        self.cache = {}  # key -> (expires_at, result)
+        self.cache_max_entries = 256  # keys include user input (city, symbols)
+        self._session = None
+        self._inflight = {}
+        self._validators = {}  # url -> (etag, last_modified, parsed body)
+        self._sem = asyncio.Semaphore(8)  # max outbound requests in flight
+
+    async def get_session(self):
+        """Return the shared ClientSession, creating it on first use.
+
+        Reusing one session keeps upstream connections alive between requests
+        instead of paying a fresh TCP+TLS handshake on every fetch.
+        """
+        if self._session is None or self._session.closed:
+            # aiodns needs a selector loop; Windows' default Proactor loop gets aiohttp's threaded resolver
+            proactor = isinstance(asyncio.get_running_loop(), getattr(asyncio, "ProactorEventLoop", ()))
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=8,
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                resolver=None if proactor else aiohttp.AsyncResolver(),  # aiodns; aiohttp defaults to a thread pool
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=UPSTREAM_TIMEOUT)
+        return self._session
+
+    async def _cached(self, key, ttl, coro_factory):
+        """Return a fresh cached result for ``key`` or fetch and store a new one.
+
+        Concurrent misses on the same key share one in-flight fetch, so only a
+        single upstream call is made; the fetch is shielded, so it keeps
+        running if a caller gives up on it. Errors and demo fallbacks are
+        never cached.
+        """
+        hit = self.cache.get(key)
+        if hit and time.monotonic() < hit[0]:
+            return hit[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            async def fetch():
+                result = await coro_factory()
+                if "error" not in result and not result.get("demo"):
+                    self._store(key, ttl, result)
+                return result
+
+            task = self._inflight[key] = asyncio.ensure_future(fetch())
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def _store(self, key, ttl, result):
+        """Cache ``result`` for ``ttl`` seconds, pruning expired and oldest entries."""
+        now = time.monotonic()
+        for k in [k for k, (expires_at, _) in self.cache.items() if expires_at <= now]:
+            del self.cache[k]
+        self.cache.pop(key, None)  # re-insert so dict order tracks insertion time
+        self.cache[key] = (now + ttl, result)
+        while len(self.cache) > self.cache_max_entries:
+            del self.cache[next(iter(self.cache))]
+
+    @contextlib.asynccontextmanager
+    async def _request(self, session, method, url, **kwargs):
+        """Send a request while holding one of the outbound request slots."""
+        async with self._sem:
+            async with session.request(method, url, **kwargs) as response:
+                yield response
+
+    def _get(self, session, url, **kwargs):
+        """GET a URL while holding one of the outbound request slots."""
+        return self._request(session, "GET", url, **kwargs)
+
+    async def _get_json(self, session, url, **kwargs):
+        """GET a URL and return the decoded JSON body."""
+        async with self._get(session, url, **kwargs) as response:
+            response.raise_for_status()
+            return orjson.loads(await response.read())
+
+    async def _get_json_revalidated(self, session, url):
+        """GET a JSON URL as a conditional request against the last response.
+
+        Sends the previous ETag / Last-Modified; on a 304 the previously parsed
+        body is returned without transferring or parsing anything.
+        """
+        headers = {}
+        previous = self._validators.get(url)
+        if previous:
+            etag, last_modified, _ = previous
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        async with self._get(session, url, headers=headers) as response:
+            if response.status == 304 and previous:
+                return previous[2]
+            if response.status != 200:
+                # e.g. a GitHub rate-limit 403; let the caller's error path handle it
+                response.raise_for_status()
+            data = orjson.loads(await response.read())
+            etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._validators[url] = (etag, last_modified, data)
+            return data
+
+    async def close(self):
+        """Close the shared session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @cached(ttl=600)
     async def fetch_weather(self, session, city="New York"):
         """Fetch current weather from wttr.in (free, no API key needed)."""
         # Try wttr.in first (free, no key needed)
         url = f"https://wttr.in/{city}?format=j1"
         try:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                data = await response.json()
+            async with self._get(session, url) as response:
+                data = orjson.loads(await response.read())
                 current = data["current_condition"][0]
                 return {
                     "source": "weather",
@@ -53,8 +255,8 @@ class DataAggregator:
             if WEATHER_API_KEY:
                 url = f"https://api.openweathermap.org/data/2.5/weather?q={city}&appid={WEATHER_API_KEY}&units=imperial"
                 try:
-                    async with session.get(url) as response:
-                        data = await response.json()
+                    async with self._get(session, url) as response:
+                        data = orjson.loads(await response.read())
                         return {
                             "source": "weather",
                             "data": {
@@ -67,52 +269,54 @@ class DataAggregator:
                         }
                 except:
                     pass
-            return {"source": "weather", "error": str(e)}
+            return {"source": "weather", "error": error_message(e)}
 
+    @cached(ttl=120)
     async def fetch_news(self, session, category="technology"):
         """Fetch top stories from Hacker News (free, no API key needed)."""
         # Use Hacker News API (free, no key needed) for tech news
         try:
             # Get top story IDs
-            async with session.get("https://hacker-news.firebaseio.com/v0/topstories.json") as response:
-                story_ids = await response.json()
-
-            # Fetch first 5 stories
+            story_ids = await self._get_json_revalidated(session, "https://hacker-news.firebaseio.com/v0/topstories.json")
+
+            # Fetch first 5 stories concurrently
+            story_ids = story_ids[:5]
+            stories = await asyncio.gather(*(
+                self._get_json(session, f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json")
+                for story_id in story_ids
+            ))
             articles = []
-            for story_id in story_ids[:5]:
-                async with session.get(f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json") as response:
-                    story = await response.json()
-                    if story and story.get("title"):
-                        articles.append({
-                            "title": story["title"],
-                            "source": "Hacker News",
-                            "url": story.get("url", f"https://news.ycombinator.com/item?id={story_id}")
-                        })
+            for story_id, story in zip(story_ids, stories):
+                if story and story.get("title"):
+                    articles.append({
+                        "title": story["title"],
+                        "source": "Hacker News",
+                        "url": story.get("url", f"https://news.ycombinator.com/item?id={story_id}")
+                    })
             return {"source": "news", "data": articles}
         except Exception as e:
             # Fallback to NewsAPI if configured
             if NEWS_API_KEY:
                 url = f"https://newsapi.org/v2/top-headlines?category={category}&country=us&pageSize=5&apiKey={NEWS_API_KEY}"
                 try:
-                    async with session.get(url) as response:
-                        data = await response.json()
+                    async with self._get(session, url) as response:
+                        data = orjson.loads(await response.read())
                         articles = [{"title": a["title"], "source": a["source"]["name"]}
                                    for a in data.get("articles", [])[:5]]
                         return {"source": "news", "data": articles}
                 except:
                     pass
-            return {"source": "news", "error": str(e)}
+            return {"source": "news", "error": error_message(e)}
 
+    @cached(ttl=30)
     async def fetch_stocks(self, session, symbols=["AAPL", "GOOGL", "MSFT"]):
         """Fetch market data - uses CoinGecko (free) for crypto or Alpha Vantage for stocks."""
         # Use CoinGecko for crypto (free, no key needed)
         try:
-            url = "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin,ethereum,solana&vs_currencies=usd&include_24hr_change=true"
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                data = await response.json()
-                crypto_map = {"bitcoin": "BTC", "ethereum": "ETH", "solana": "SOL"}
+            async with self._get(session, COINGECKO_URL) as response:
+                data = orjson.loads(await response.read())
                 stocks = []
-                for coin_id, symbol in crypto_map.items():
+                for coin_id, symbol in CRYPTO_MAP:
                     if coin_id in data:
                         price = data[coin_id]["usd"]
                         change_pct = data[coin_id].get("usd_24h_change", 0)
@@ -126,67 +330,121 @@ class DataAggregator:
         except Exception as e:
             # Fallback to Alpha Vantage if configured
             if ALPHA_VANTAGE_KEY:
+                symbols = symbols[:3]
+                payloads = await asyncio.gather(*(
+                    self._get_json(session, f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol={symbol}&apikey={ALPHA_VANTAGE_KEY}")
+                    for symbol in symbols
+                ), return_exceptions=True)
                 stocks = []
-                for symbol in symbols[:3]:
-                    url = f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol={symbol}&apikey={ALPHA_VANTAGE_KEY}"
+                for symbol, data in zip(symbols, payloads):
                     try:
-                        async with session.get(url) as response:
-                            data = await response.json()
-                            quote = data.get("Global Quote", {})
-                            if quote:
-                                stocks.append({
-                                    "symbol": symbol,
-                                    "price": float(quote.get("05. price", 0)),
-                                    "change": float(quote.get("09. change", 0)),
-                                    "change_pct": float(quote.get("10. change percent", "0%").replace("%", ""))
-                                })
+                        quote = data.get("Global Quote", {})
+                        if quote:
+                            stocks.append({
+                                "symbol": symbol,
+                                "price": float(quote.get("05. price", 0)),
+                                "change": float(quote.get("09. change", 0)),
+                                "change_pct": float(quote.get("10. change percent", "0%").replace("%", ""))
+                            })
                     except:
                         pass
                 if stocks:
                     return {"source": "stocks", "data": stocks}
-            return {"source": "stocks", "error": str(e)}
+            return {"source": "stocks", "error": error_message(e)}
 
+    @cached(ttl=900)
     async def fetch_github_trending(self, session):
         """Fetch trending repos from GitHub."""
-        url = "https://api.github.com/search/repositories?q=created:>2025-01-01&sort=stars&order=desc&per_page=5"
+        if GITHUB_TOKEN:
+            # GraphQL (needs a token) returns just the fields we use instead of full repo objects
+            headers = {"Authorization": f"bearer {GITHUB_TOKEN}", "Content-Type": "application/json"}
+            try:
+                async with self._request(session, "POST", GITHUB_GRAPHQL_URL,
+                                         data=GITHUB_TRENDING_QUERY, headers=headers) as response:
+                    response.raise_for_status()  # a bad token is a 401
+                    data = orjson.loads(await response.read())
+                    repos = [{"name": r["nameWithOwner"], "stars": r["stargazerCount"], "description": r["description"][:80] if r["description"] else ""}
+                            for r in data["data"]["search"]["nodes"]]
+                    return {"source": "github", "data": repos}
+            except Exception as e:
+                # Fall back to the public REST search, but surface e.g. a bad token
+                app.logger.warning("github GraphQL fetch failed: %r", e)
+
         try:
-            async with session.get(url) as response:
-                data = await response.json()
-                repos = [{"name": r["full_name"], "stars": r["stargazers_count"], "description": r["description"][:80] if r["description"] else ""}
-                        for r in data.get("items", [])[:5]]
-                return {"source": "github", "data": repos}
+            # Unchanged results come back as a 304, which doesn't count against the rate limit
+            data = await self._get_json_revalidated(session, GITHUB_SEARCH_URL)
+            repos = [{"name": r["full_name"], "stars": r["stargazers_count"], "description": r["description"][:80] if r["description"] else ""}
+                    for r in data.get("items", [])[:5]]
+            return {"source": "github", "data": repos}
         except Exception as e:
-            return {"source": "github", "error": str(e), "demo": True,
+            return {"source": "github", "error": error_message(e), "demo": True,
                     "data": [{"name": "cool/project", "stars": 1234, "description": "Something interesting"}]}
 
+    @cached(ttl=3600)
     async def fetch_quote(self, session):
         """Fetch inspirational quote."""
-        url = "https://api.quotable.io/random"
         try:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
-                data = await response.json()
+            async with self._get(session, QUOTE_URL) as response:
+                data = orjson.loads(await response.read())
                 return {"source": "quote", "data": {"text": data["content"], "author": data["author"]}}
         except:
-            quotes = [
-                {"text": "The best way to predict the future is to create it.", "author": "Peter Drucker"},
-                {"text": "Innovation distinguishes between a leader and a follower.", "author": "Steve Jobs"},
-                {"text": "The only way to do great work is to love what you do.", "author": "Steve Jobs"},
-            ]
-            import random
-            return {"source": "quote", "data": random.choice(quotes), "demo": True}
-
-    async def gather_all(self, city="New York", news_category="technology"):
-        """Fetch all data sources concurrently."""
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self.fetch_weather(session, city),
-                self.fetch_news(session, news_category),
-                self.fetch_stocks(session),
-                self.fetch_github_trending(session),
-                self.fetch_quote(session),
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            return {r["source"]: r for r in results if isinstance(r, dict)}
+            return {"source": "quote", "data": random.choice(QUOTES_FALLBACK), "demo": True}
+
+    def _fetch_tasks(self, session, city, news_category):
+        """Start a task for every dashboard data source, keyed by source name."""
+        return {
+            "weather": asyncio.ensure_future(_safe("weather", self.fetch_weather(session, city))),
+            "news": asyncio.ensure_future(_safe("news", self.fetch_news(session, news_category))),
+            "stocks": asyncio.ensure_future(_safe("stocks", self.fetch_stocks(session))),
+            "github": asyncio.ensure_future(_safe("github", self.fetch_github_trending(session))),
+            "quote": asyncio.ensure_future(_safe("quote", self.fetch_quote(session))),
+        }
+
+    async def gather_stream(self, city="New York", news_category="technology", deadline=2.0):
+        """Fetch all data sources concurrently, yielding each result as it lands.
+
+        Sources not ready after ``deadline`` seconds are yielded as
+        ``{"status": "pending"}``. Their upstream fetch keeps running, so a
+        follow-up widget request joins it instead of starting another.
+        """
+        session = await self.get_session()
+        names = {task: name for name, task in self._fetch_tasks(session, city, news_category).items()}
+        loop = asyncio.get_running_loop()
+        end = loop.time() + deadline
+        pending = set(names)
+        while pending:
+            done, pending = await asyncio.wait(pending, timeout=end - loop.time(),
+                                               return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                yield task.result()
+        for task in pending:
+            task.cancel()
+            yield {"source": names[task], "status": "pending"}
+
+    async def gather_for_briefing(self, city="New York", news_category="technology", deadline=2.0, grace=0.25):
+        """Fetch the sources a briefing uses without waiting on stragglers.
+
+        Waits up to ``deadline`` seconds (the same bound as /api/data) for
+        weather and stocks, then gives news and the quote ``grace`` seconds
+        more; the briefing is built from whatever has arrived. Fetches still running keep going in the
+        background and warm the cache for the next request.
+        """
+        session = await self.get_session()
+        required = [
+            asyncio.ensure_future(_safe("weather", self.fetch_weather(session, city))),
+            asyncio.ensure_future(_safe("stocks", self.fetch_stocks(session))),
+        ]
+        optional = [
+            asyncio.ensure_future(_safe("news", self.fetch_news(session, news_category))),
+            asyncio.ensure_future(_safe("quote", self.fetch_quote(session))),
+        ]
+        _, pending = await asyncio.wait(required, timeout=deadline)
+        _, pending_optional = await asyncio.wait(optional, timeout=grace)
+        for task in pending | pending_optional:
+            task.cancel()
+        return {r["source"]: r for r in (t.result() for t in required + optional if t.done())}
 
 
 class AIBriefingGenerator:
@@ -194,39 +452,60 @@ class AIBriefingGenerator:
 
     def __init__(self):
         self.api_key = OPENAI_API_KEY
-
-    async def generate_briefing(self, data):
-        """Generate a personalized briefing using OpenAI."""
-        if not self.api_key:
-            return self._generate_mock_briefing(data)
-
-        import openai
-        client = openai.OpenAI(api_key=self.api_key)
-
+        self._client = None
+        if self.api_key:
+            import openai
+            # One async client per process; its connection pool is reused across briefings
+            self._client = openai.AsyncOpenAI(api_key=self.api_key)
+
+    async def stream_briefing(self, data):
+        """Yield briefing events, streaming OpenAI tokens as they arrive.
+
+        Emits ``{"delta": text}`` events followed by one final event carrying
+        the briefing metadata. If OpenAI fails before any token arrives the
+        mock briefing is sent instead; if it fails mid-stream the final event
+        carries an ``error`` so the partial briefing isn't shown as complete.
+        """
+        if self._client:
+            streamed = False
+            error = None
+            try:
+                stream = await self._client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=self._build_messages(data),
+                    temperature=0.7,
+                    max_tokens=300,
+                    stream=True
+                )
+                # Closes the upstream response if we stop early (client went away)
+                async with stream:
+                    async for chunk in stream:
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if delta:
+                            streamed = True
+                            yield {"delta": delta}
+            except Exception as e:
+                app.logger.warning("briefing stream failed: %r", e)
+                error = error_message(e)
+            if streamed:
+                final = {"generated_at": iso_now(), "ai_powered": True}
+                if error:
+                    final["error"] = f"Briefing interrupted: {error}"
+                yield final
+                return
+
+        briefing = self._generate_mock_briefing(data)
+        yield {"delta": briefing.pop("briefing")}
+        yield briefing
+
+    def _build_messages(self, data):
+        """Build the chat messages for a briefing request."""
         # Build context from aggregated data
         context = self._build_context(data)
-
-        try:
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": """You are a personal intelligence briefing assistant.
-                    Generate a concise, engaging morning briefing based on the provided data.
-                    Be conversational but professional. Highlight what's most relevant.
-                    Include 2-3 actionable insights or things to watch today.
-                    Keep it under 200 words."""},
-                    {"role": "user", "content": f"Generate my morning briefing based on this data:\n\n{context}"}
-                ],
-                temperature=0.7,
-                max_tokens=300
-            )
-            return {
-                "briefing": response.choices[0].message.content,
-                "generated_at": datetime.now().isoformat(),
-                "ai_powered": True
-            }
-        except Exception as e:
-            return self._generate_mock_briefing(data)
+        return [
+            {"role": "system", "content": BRIEFING_SYSTEM_PROMPT},
+            {"role": "user", "content": f"Generate my morning briefing based on this data:\n\n{context}"}
+        ]
 
     def _build_context(self, data):
         """Build context string from aggregated data."""
@@ -252,114 +531,171 @@ class AIBriefingGenerator:
 
     def _generate_mock_briefing(self, data):
         """Generate a mock briefing when OpenAI is not available."""
-        context = self._build_context(data)
-
-        briefing = f"""Good morning! Here's your intelligence briefing for {datetime.now().strftime('%A, %B %d')}:
-
-**Weather & Environment**
-"""
+        today = datetime.now().strftime('%A, %B %d')
+        # Sections whose source hasn't arrived are left out rather than shown empty
+        parts = [f"Good morning! Here's your intelligence briefing for {today}:\n"]
         if "weather" in data and "data" in data["weather"]:
             w = data["weather"]["data"]
-            briefing += f"It's {w['temp']}°F and {w['condition'].lower()} in {w['city']}. "
+            parts.append(f"\n**Weather & Environment**\nIt's {w['temp']}°F and {w['condition'].lower()} in {w['city']}. \n")
 
-        briefing += "\n\n**What's Moving**\n"
-        if "stocks" in data and "data" in data["stocks"] and isinstance(data["stocks"]["data"], list):
+        if "stocks" in data and isinstance(data["stocks"].get("data"), list) and data["stocks"]["data"]:
+            parts.append("\n**What's Moving**\n")
             for s in data["stocks"]["data"]:
                 direction = "up" if s["change_pct"] > 0 else "down"
-                briefing += f"• {s['symbol']} is {direction} {abs(s['change_pct']):.1f}% at ${s['price']:.2f}\n"
+                parts.append(f"• {s['symbol']} is {direction} {abs(s['change_pct']):.1f}% at ${s['price']:.2f}\n")
 
-        briefing += "\n**Headlines to Watch**\n"
-        if "news" in data and "data" in data["news"]:
+        if "news" in data and data["news"].get("data"):
+            parts.append("\n**Headlines to Watch**\n")
             for n in data["news"]["data"][:3]:
-                briefing += f"• {n['title']}\n"
+                parts.append(f"• {n['title']}\n")
 
         if "quote" in data and "data" in data["quote"]:
             q = data["quote"]["data"]
-            briefing += f"\n**Thought for Today**\n\"{q['text']}\" — {q['author']}"
+            parts.append(f"\n**Thought for Today**\n\"{q['text']}\" — {q['author']}")
 
         return {
-            "briefing": briefing,
-            "generated_at": datetime.now().isoformat(),
+            "briefing": "".join(parts),
+            "generated_at": iso_now(),
             "ai_powered": False,
             "demo_mode": True
         }
 
 
+def print_banner():
+    print("\n" + "=" * 60)
+    print("  Command Center - Personal Intelligence Dashboard")
+    print("=" * 60)
+    print("\n  Dashboard: http://localhost:5020")
+    print("\n  Configure API keys in .env for full functionality:")
+    print("    - OPENAI_API_KEY (AI briefings)")
+    print("    - OPENWEATHER_API_KEY (weather)")
+    print("    - NEWS_API_KEY (headlines)")
+    print("    - ALPHA_VANTAGE_KEY (stocks)")
+    print("    - GITHUB_TOKEN (trending repos via GraphQL)")
+    print("\n  Demo mode works without API keys!")
+    print("\n  Press Ctrl+C to stop\n")
+
+
+if __name__ == "__main__":
+    print_banner()
+    if os.name == "posix" and importlib.util.find_spec("gunicorn"):
+        # Hand the process to gunicorn before the loop and session below are
+        # created; each worker imports this module and sets up its own
+        sys.stdout.flush()
+        os.execvp(sys.executable, [sys.executable, "-m", "gunicorn", "-k", "gthread", "-w", "2", "--threads", "16",
+                                   "--bind", "127.0.0.1:5020", "--chdir", os.path.dirname(os.path.abspath(__file__)),
+                                   "app:app"])
+
+
 # Initialize services
 aggregator = DataAggregator()
 briefing_generator = AIBriefingGenerator()
 
+# One long-lived event loop shared by all requests, so the ClientSession
+# (which is bound to a loop) and its connection pool survive between calls
+LOOP = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+LOOP_PID = os.getpid()
+threading.Thread(target=lambda: (asyncio.set_event_loop(LOOP), LOOP.run_forever()), daemon=True).start()
+
+
+def run_async(coro):
+    """Run a coroutine on the background loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, LOOP).result()
+
+
+def iter_async(agen):
+    """Iterate an async generator from sync code, driving it on the background loop."""
+    items = queue.Queue()
+    done = object()
+
+    async def pump():
+        try:
+            async for item in agen:
+                items.put(item)
+        finally:
+            await agen.aclose()
+            items.put(done)
+
+    fut = asyncio.run_coroutine_threadsafe(pump(), LOOP)
+    try:
+        while (item := items.get()) is not done:
+            yield item
+        fut.result()
+    finally:
+        # The consumer stopped early (e.g. the client disconnected): stop the producer too
+        if not fut.done():
+            fut.cancel()
+
+
+WIDGET_DISPATCH = {
+    "weather": lambda s, a: aggregator.fetch_weather(s, a.get("city", "New York")),
+    "news": lambda s, a: aggregator.fetch_news(s, a.get("category", "technology")),
+    "stocks": lambda s, a: aggregator.fetch_stocks(s, a.get("symbols", "AAPL,GOOGL,MSFT").split(",")),
+    "github": lambda s, a: aggregator.fetch_github_trending(s),
+    "quote": lambda s, a: aggregator.fetch_quote(s),
+}
+
+
+async def fetch_widget(fetch, args):
+    """Run a WIDGET_DISPATCH entry with the aggregator's current session."""
+    return await fetch(await aggregator.get_session(), args)
+
+
+@atexit.register
+def shutdown():
+    """Release pooled upstream connections on process exit."""
+    if os.getpid() != LOOP_PID:
+        return  # forked child: the loop thread didn't survive the fork
+    asyncio.run_coroutine_threadsafe(aggregator.close(), LOOP).result(timeout=5)
+    LOOP.call_soon_threadsafe(LOOP.stop)
+
 
 @app.route("/")
+@functools.lru_cache(maxsize=1)
 def dashboard():
+    # The page is static; render it once
     return render_template("dashboard.html")
 
 
 @app.route("/api/data")
 def get_data():
-    """Fetch all aggregated data."""
+    """Stream aggregated data as NDJSON, one source per line as each arrives."""
     city = request.args.get("city", "New York")
     category = request.args.get("category", "technology")
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    data = loop.run_until_complete(aggregator.gather_all(city, category))
-    loop.close()
+    def lines():
+        for result in iter_async(aggregator.gather_stream(city, category)):
+            yield orjson.dumps(result) + b"\n"
 
-    return jsonify({"data": data, "timestamp": datetime.now().isoformat()})
+    return Response(stream_with_context(lines()), mimetype="application/x-ndjson")
 
 
 @app.route("/api/briefing")
 def get_briefing():
-    """Generate AI briefing from current data."""
+    """Stream an AI briefing from current data as server-sent events."""
     city = request.args.get("city", "New York")
     category = request.args.get("category", "technology")
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    data = loop.run_until_complete(aggregator.gather_all(city, category))
-    briefing = loop.run_until_complete(briefing_generator.generate_briefing(data))
-    loop.close()
+    data = run_async(aggregator.gather_for_briefing(city, category))
+
+    def events():
+        for event in iter_async(briefing_generator.stream_briefing(data)):
+            yield b"data: " + orjson.dumps(event) + b"\n\n"
 
-    return jsonify(briefing)
+    return Response(stream_with_context(events()), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 
 @app.route("/api/widget/<widget_type>")
 def get_widget(widget_type):
     """Fetch data for a specific widget."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
-    async def fetch():
-        async with aiohttp.ClientSession() as session:
-            if widget_type == "weather":
-                return await aggregator.fetch_weather(session, request.args.get("city", "New York"))
-            elif widget_type == "news":
-                return await aggregator.fetch_news(session, request.args.get("category", "technology"))
-            elif widget_type == "stocks":
-                symbols = request.args.get("symbols", "AAPL,GOOGL,MSFT").split(",")
-                return await aggregator.fetch_stocks(session, symbols)
-            elif widget_type == "github":
-                return await aggregator.fetch_github_trending(session)
-            elif widget_type == "quote":
-                return await aggregator.fetch_quote(session)
-            return {"error": "Unknown widget type"}
-
-    result = loop.run_until_complete(fetch())
-    loop.close()
-    return jsonify(result)
+    fetch = WIDGET_DISPATCH.get(widget_type)
+    if fetch is None:
+        return ojsonify({"error": "Unknown widget type"})
+    # request.args is read here; only the fetch itself runs on the loop thread
+    return ojsonify(run_async(_safe(widget_type, fetch_widget(fetch, request.args))))
 
 
 if __name__ == "__main__":
-    print("\n" + "=" * 60)
-    print("  Command Center - Personal Intelligence Dashboard")
-    print("=" * 60)
-    print("\n  Dashboard: http://localhost:5020")
-    print("\n  Configure API keys in .env for full functionality:")
-    print("    - OPENAI_API_KEY (AI briefings)")
-    print("    - OPENWEATHER_API_KEY (weather)")
-    print("    - NEWS_API_KEY (headlines)")
-    print("    - ALPHA_VANTAGE_KEY (stocks)")
-    print("\n  Demo mode works without API keys!")
-    print("\n  Press Ctrl+C to stop\n")
-    app.run(debug=True, port=5020)
+    # Only reached on Windows (gunicorn is POSIX-only) or where gunicorn isn't installed
+    app.run(port=5020, threaded=True)
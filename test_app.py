@@ -0,0 +1,43 @@
+import contextlib
+import unittest
+
+import app
+
+
+class FakeResponse:
+    status = 200
+    headers = {}
+
+    async def read(self):
+        return b'{"bitcoin": {"usd": 100.0, "usd_24h_change": 1.0}}'
+
+
+class InflightCoalescingTest(unittest.TestCase):
+    def setUp(self):
+        self.urls = []
+
+        @contextlib.asynccontextmanager
+        async def slow_get(session, url, **kwargs):
+            self.urls.append(url)
+            await app.asyncio.sleep(0.3)
+            yield FakeResponse()
+
+        app.aggregator.cache.clear()
+        app.aggregator._get = slow_get
+
+    def tearDown(self):
+        del app.aggregator._get
+        app.aggregator.cache.clear()
+
+    def test_pending_widget_request_joins_dashboard_fetch(self):
+        results = list(app.iter_async(app.aggregator.gather_stream(deadline=0.05)))
+        self.assertIn({"source": "stocks", "status": "pending"}, results)
+
+        stocks = app.run_async(app.fetch_widget(app.WIDGET_DISPATCH["stocks"], {}))
+
+        self.assertEqual(stocks["data"][0]["symbol"], "BTC")
+        self.assertEqual(self.urls.count(app.COINGECKO_URL), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()